@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 
 from celery_config import celery_app
@@ -30,7 +30,15 @@ def get_task_status(task_id):
             'meta': task.info
         }), 202
     elif task.state == states.SUCCESS:
-        return jsonify(task.result), 200
+        result = task.result
+        if isinstance(result, dict) and 'result_key' in result:
+            # The task only returns a pointer; the full payload lives in its
+            # own Redis key so the result backend stays small
+            payload = celery_app.backend.client.get(f"plate-result:{result['result_key']}")
+            if payload is None:
+                return jsonify({'status': 'expired', 'error': 'Result no longer available'}), 410
+            return Response(payload, mimetype='application/json'), 200
+        return jsonify(result), 200
     elif task.state == states.FAILURE:
         return jsonify({'status': 'failed', 'error': str(task.info)}), 500
     else:
@@ -38,4 +46,12 @@ def get_task_status(task_id):
 
 
 if __name__ == '__main__':
-    app.run(host='192.168.2.57', port=5200, debug=True)
\ No newline at end of file
+    # Local development fallback only. In production run the threaded
+    # gunicorn server so status polls don't block new optimization posts:
+    #   gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5200 app:app
+    import os
+    app.run(
+        host=os.environ.get('FLASK_HOST', '0.0.0.0'),
+        port=int(os.environ.get('FLASK_PORT', 5200)),
+        debug=os.environ.get('FLASK_DEBUG', '') == '1',
+    )
\ No newline at end of file
@@ -1,3 +1,5 @@
+import os
+
 from celery import Celery
 
 # Connect to Redis (running locally on port 6379)
@@ -8,13 +10,23 @@ celery_app = Celery(
     backend='redis://localhost:6379/0'
 )
 
-# Use gevent pool for better Windows compatibility
+# Each CP-SAT solve spawns its own search threads, so running many Celery
+# workers on top of that just oversubscribes the cores. Size the prefork pool
+# so (Celery workers x solver threads) roughly matches the machine, and keep
+# the heavy solves on their own queue:
+#   celery -A celery_worker worker -Q optimize -c 1 --pool=prefork
+CP_SAT_SEARCH_WORKERS = 8
+
 celery_app.conf.update(
-    #worker_pool='gevent',
-    worker_concurrency=4,  # Adjust based on your needs
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    worker_concurrency=max(1, (os.cpu_count() or 1) // CP_SAT_SEARCH_WORKERS),
+    task_routes={
+        'plate_tasks.run_plate_optimization': {'queue': 'optimize'},
+    },
+    # msgpack encodes/decodes large tag lists several times faster than json
+    # and produces noticeably smaller Redis payloads
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
     timezone='UTC',
     enable_utc=True,
 )
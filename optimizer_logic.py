@@ -1,147 +1,158 @@
 
 from ortools.sat.python import cp_model
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import logging
+import os
+import random
 import time
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
 class PlateOptimizationCallback(cp_model.CpSolverSolutionCallback):
-    def __init__(self, tag_to_plate, ups_vars, plate_sheets, tags, plate_count, ups_per_plate, verbose=False):
+    def __init__(self, tag_to_plate, ups_vars, plate_sheets, tags, verbose=False):
         super().__init__()
-        self.best_solution = None
+        self.best_raw = None
         self.best_obj = float('inf')
         self.tag_to_plate = tag_to_plate
         self.ups_vars = ups_vars
         self.plate_sheets = plate_sheets
-        self.tags = tags
-        self.plate_count = plate_count
-        self.ups_per_plate = ups_per_plate
         self.verbose = verbose
         self.solution_count = 0
         
         # Track improvement timing for early stopping (only for large datasets > 100)
         self.use_improvement_stopping = len(tags) > 100
         if self.use_improvement_stopping:
-            self.last_improvement_time = time.time()
+            self.last_improvement_time = time.monotonic()
             self.improvement_timeout = 600  # 10 minutes in seconds
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
 
     def on_solution_callback(self):
         self.solution_count += 1
-        obj = sum(self.Value(s) for s in self.plate_sheets)
+        sheet_vals = [self.Value(s) for s in self.plate_sheets]
+        obj = sum(sheet_vals)
 
         if obj < self.best_obj:
             self.best_obj = obj
             if self.use_improvement_stopping:
-                self.last_improvement_time = time.time()  # Reset improvement timer
-            results = []
-            totalProduced = 0
-            totalItems = sum(tag['QTY'] for tag in self.tags)
-
-            for j in range(self.plate_count):
-                for i in range(len(self.tags)):
-                    if self.Value(self.tag_to_plate[i]) == j:
-                        ups = self.Value(self.ups_vars[i])
-                        sheets = self.Value(self.plate_sheets[j])
-                        produced = ups * sheets
-                        item = self.tags[i]
-
-                        result = {
-                            "COLOR": item["COLOR"],
-                            "SIZE": item["SIZE"],
-                            "QTY": item["QTY"],
-                            "PLATE": chr(65 + j),
-                            "OPTIMAL_UPS": ups,
-                            "SHEETS_NEEDED": sheets,
-                            "QTY_PRODUCED": produced,
-                            "EXCESS": produced - item["QTY"]
-                        }
-
-                        # Add optional CEO fields if they exist
-                        for field in ["ITEM_DESCRIPTION", "ITEM_CODE", "PRICE", "EP_NO", "RUN", "SHEET"]:
-                            if field in item:
-                                result[field] = item[field]
-
-                        results.append(result)
-                        totalProduced += produced
-
-            totalSheets = sum(self.Value(s) for s in self.plate_sheets)
-            totalExcess = totalProduced - totalItems
-            waste = round((totalExcess / totalProduced) * 100, 2) if totalProduced else 0.0
-
-            self.best_solution = {
-                "results": results,
-                "summary": {
-                    "totalSheets": totalSheets,
-                    "totalProduced": totalProduced,
-                    "totalExcess": totalExcess,
-                    "wastePercentage": waste,
-                    "totalPlates": self.plate_count,
-                    "totalItems": totalItems,
-                    "upsCapacity": self.ups_per_plate,
-                }
-            }
-
-            if self.verbose:
+                self.last_improvement_time = time.monotonic()  # Reset improvement timer
+
+            # Stash only the raw value arrays (one Value() call per variable);
+            # the full results/summary dict is built once after the search ends
+            self.best_raw = (
+                [self.Value(v) for v in self.tag_to_plate],
+                [self.Value(v) for v in self.ups_vars],
+                sheet_vals,
+            )
+
+            # One guarded log line per improvement instead of a block of prints
+            if self.verbose and logger.isEnabledFor(logging.INFO):
                 if self.use_improvement_stopping:
-                    elapsed_time = time.time() - self.start_time
-                    print(f"\n🟢 New Best Solution Found!")
-                    print(f"   ➤ Total Sheets: {totalSheets}")
-                    print(f"   ➤ Waste %     : {waste}%")
-                    print(f"   ➤ Excess Qty  : {totalExcess}")
-                    print(f"   ➤ Produced    : {totalProduced}")
-                    print(f"   ➤ Solution #{self.solution_count}")
-                    print(f"   ➤ Time Elapsed: {elapsed_time:.1f}s\n")
+                    logger.info('New best solution: sheets=%d sol#%d elapsed=%.1fs',
+                                obj, self.solution_count, time.monotonic() - self.start_time)
                 else:
-                    print(f"\n🟢 New Best Solution Found!")
-                    print(f"   ➤ Total Sheets: {totalSheets}")
-                    print(f"   ➤ Waste %     : {waste}%")
-                    print(f"   ➤ Excess Qty  : {totalExcess}")
-                    print(f"   ➤ Produced    : {totalProduced}")
-                    print(f"   ➤ Solution #{self.solution_count}\n")
+                    logger.info('New best solution: sheets=%d sol#%d', obj, self.solution_count)
         
-        # Check if we should stop due to no improvement (only for large datasets > 100)
-        if self.use_improvement_stopping:
-            current_time = time.time()
+        # Check if we should stop due to no improvement (only for large datasets > 100).
+        # Only look at the clock every 32 solutions to keep the hot path cheap.
+        if self.use_improvement_stopping and self.solution_count & 31 == 0:
+            current_time = time.monotonic()
             time_since_improvement = current_time - self.last_improvement_time
-            
+
             if time_since_improvement >= self.improvement_timeout:
                 if self.verbose:
-                    total_elapsed = current_time - self.start_time
-                    print(f"\n🛑 Stopping solver: No improvement for {self.improvement_timeout/60:.1f} minutes")
-                    print(f"   ➤ Total runtime: {total_elapsed/60:.1f} minutes")
-                    print(f"   ➤ Solutions found: {self.solution_count}")
-                    print(f"   ➤ Best objective: {self.best_obj}\n")
-                
+                    logger.info(
+                        'Stopping solver: no improvement for %.1f min '
+                        '(runtime=%.1f min, solutions=%d, best=%s)',
+                        self.improvement_timeout / 60, (current_time - self.start_time) / 60,
+                        self.solution_count, self.best_obj)
+
                 self.StopSearch()
 
+def build_solution(tags, best_raw, plate_count, ups_per_plate, total_items):
+    """Materialize the results/summary dict from the raw solver value arrays."""
+    plate_of, ups_of, sheets_of = best_raw
+    results = []
+    totalProduced = 0
+
+    buckets = [[] for _ in range(plate_count)]
+    for i, p in enumerate(plate_of):
+        buckets[p].append(i)
+
+    for j, idxs in enumerate(buckets):
+        for i in idxs:
+            ups = ups_of[i]
+            sheets = sheets_of[j]
+            produced = ups * sheets
+            item = tags[i]
+
+            result = {
+                "COLOR": item["COLOR"],
+                "SIZE": item["SIZE"],
+                "QTY": item["QTY"],
+                "PLATE": chr(65 + j),
+                "OPTIMAL_UPS": ups,
+                "SHEETS_NEEDED": sheets,
+                "QTY_PRODUCED": produced,
+                "EXCESS": produced - item["QTY"]
+            }
+
+            # Add optional CEO fields if they exist
+            for field in ["ITEM_DESCRIPTION", "ITEM_CODE", "PRICE", "EP_NO", "RUN", "SHEET"]:
+                if field in item:
+                    result[field] = item[field]
+
+            results.append(result)
+            totalProduced += produced
+
+    totalSheets = sum(sheets_of)
+    totalExcess = totalProduced - total_items
+    waste = round((totalExcess / totalProduced) * 100, 2) if totalProduced else 0.0
+
+    return {
+        "results": results,
+        "summary": {
+            "totalSheets": totalSheets,
+            "totalProduced": totalProduced,
+            "totalExcess": totalExcess,
+            "wastePercentage": waste,
+            "totalPlates": plate_count,
+            "totalItems": total_items,
+            "upsCapacity": ups_per_plate,
+        }
+    }
+
 def assign_ups_proportional(group, ups_per_plate):
-    total_qty = sum(item['QTY'] for item in group)
-    raw_ups = [
-        max(1, round((item['QTY'] / total_qty) * ups_per_plate)) for item in group
-    ]
-
-    # Balance ups to make sure they sum exactly to ups_per_plate
-    while sum(raw_ups) < ups_per_plate:
-        min_index = raw_ups.index(min(raw_ups))
-        raw_ups[min_index] += 1
-    while sum(raw_ups) > ups_per_plate:
-        max_index = raw_ups.index(max(raw_ups))
-        if raw_ups[max_index] > 1:
-            raw_ups[max_index] -= 1
-        else:
-            break
-
-    return raw_ups
+    qty = np.fromiter((item['QTY'] for item in group), dtype=np.int64, count=len(group))
+    raw = qty * (ups_per_plate / qty.sum())
+    ups = np.maximum(1, raw.astype(np.int64))
+    deficit = ups_per_plate - int(ups.sum())
+
+    if deficit > 0:
+        # Largest-remainder: hand the leftover ups to the entries whose
+        # proportional share was cut the most by flooring
+        order = np.argsort(ups - raw, kind='stable')
+        for k in range(deficit):
+            ups[order[k % len(order)]] += 1
+    elif deficit < 0:
+        # Overshoot comes from the min-1 floors; take back from the largest
+        # entries, never dropping anyone below 1
+        for i in np.argsort(-ups, kind='stable'):
+            if deficit == 0:
+                break
+            give_back = min(int(ups[i]) - 1, -deficit)
+            ups[i] -= give_back
+            deficit += give_back
+
+    return ups.tolist()
 
 def initial_balanced_partition_no_singles(tags, plate_count):
     """Enhanced partitioning that avoids single-tag plates"""
-    plates = [[] for _ in range(plate_count)]
-    plate_loads = [0] * plate_count
-    sorted_tags = sorted(tags, key=lambda t: t['QTY'], reverse=True)
-
     # First pass: distribute tags normally
-    for tag in sorted_tags:
-        min_index = plate_loads.index(min(plate_loads))
-        plates[min_index].append(tag)
-        plate_loads[min_index] += tag['QTY']
+    plates = initial_balanced_partition(tags, plate_count)
+    plate_loads = [sum(tag['QTY'] for tag in plate) for plate in plates]
 
     # Second pass: fix single-tag plates by redistributing
     for i in range(len(plates)):
@@ -174,21 +185,65 @@ def greedy_initialize(tags, ups_per_plate, plate_count):
 
     return initial_assignment
 
+def seed_objective(seed_solution):
+    """Cheap sheet-count estimate of a seed: max ceil(QTY / ups) per plate."""
+    sheets = {}
+    for tag, plate_index, ups in seed_solution:
+        needed = -(-tag['QTY'] // ups)
+        if needed > sheets.get(plate_index, 0):
+            sheets[plate_index] = needed
+    return sum(sheets.values())
+
+def _greedy_variant(args):
+    """One greedy start; module-level so it can be shipped to a worker process."""
+    tags, ups_per_plate, plate_count, variant = args
+    if variant:
+        # Shuffling before the stable QTY sort randomizes tie-breaking,
+        # which is enough to diversify the partitions
+        tags = list(tags)
+        random.Random(variant).shuffle(tags)
+    return greedy_initialize(tags, ups_per_plate, plate_count)
+
+def multi_start_greedy(tags, ups_per_plate, plate_count, num_starts=8, max_workers=4):
+    """Run several randomized greedy starts in parallel and keep the best seed.
+
+    The greedy pipeline only reads QTY, so worker processes get lightweight
+    proxy dicts and the winning seed is mapped back onto the original tags.
+    """
+    proxies = [{'QTY': tag['QTY'], 'index': i} for i, tag in enumerate(tags)]
+    jobs = [(proxies, ups_per_plate, plate_count, variant) for variant in range(num_starts)]
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            seeds = list(executor.map(_greedy_variant, jobs))
+    except Exception:
+        # Daemonized Celery workers cannot fork children; run the starts serially
+        seeds = [_greedy_variant(job) for job in jobs]
+
+    best_seed = min(seeds, key=seed_objective)
+    return [(tags[proxy['index']], plate_index, ups) for proxy, plate_index, ups in best_seed]
+
 def initial_balanced_partition(tags, plate_count):
     plates = [[] for _ in range(plate_count)]
-    plate_loads = [0] * plate_count
-    sorted_tags = sorted(tags, key=lambda t: t['QTY'], reverse=True)
-
-    for tag in sorted_tags:
-        min_index = plate_loads.index(min(plate_loads))
-        plates[min_index].append(tag)
-        plate_loads[min_index] += tag['QTY']
+    # LPT with a heap: always drop the next-largest tag onto the currently
+    # lightest plate in O(log P) instead of scanning all plate loads
+    heap = [(0, j) for j in range(plate_count)]
+    heapq.heapify(heap)
+
+    # argsort the quantity vector once instead of a keyed Python sort;
+    # stable descending order keeps the old tie-breaking
+    qty = np.fromiter((t['QTY'] for t in tags), dtype=np.int64, count=len(tags))
+    for i in np.argsort(-qty, kind='stable'):
+        load, min_index = heapq.heappop(heap)
+        plates[min_index].append(tags[i])
+        heapq.heappush(heap, (load + int(qty[i]), min_index))
 
     return plates
 
 def solve_plate_optimization(tags, ups_per_plate, plate_count, seed_solution, verbose=False):
     model = cp_model.CpModel()
     num_tags = len(tags)
+    total_items = sum(tag['QTY'] for tag in tags)  # computed once, shared below
     all_plates = range(plate_count)
     enforce_min_tags = len(tags) > 100
 
@@ -196,36 +251,79 @@ def solve_plate_optimization(tags, ups_per_plate, plate_count, seed_solution, ve
     ups_vars = [model.NewIntVar(1, ups_per_plate, f'ups_{i}') for i in range(num_tags)]
     plate_sheets = [model.NewIntVar(1, 10000, f'plate_sheet_{j}') for j in all_plates]
     
-    # Apply greedy hints if available
+    # Apply the greedy seed as one complete, batched solution hint
     if seed_solution:
-        for i, (tag, plate_index, ups) in enumerate(seed_solution):
-            model.AddHint(tag_to_plate[i], plate_index)
-            model.AddHint(ups_vars[i], ups)
-            
+        tag_index = {id(tag): i for i, tag in enumerate(tags)}
+        sheet_hints = [1] * plate_count
+        used_plates = set()
+        for tag, plate_index, ups in seed_solution:
+            used_plates.add(plate_index)
+            # Sheets needed on a plate = max over its tags of ceil(QTY / ups)
+            sheet_hints[plate_index] = max(sheet_hints[plate_index], -(-tag['QTY'] // ups))
+
+        # Relabel the seed's plates to match the symmetry-breaking order:
+        # used plates first, sorted by hinted sheet count, then unused plates
+        ordered = sorted(used_plates, key=lambda j: sheet_hints[j])
+        ordered += [j for j in all_plates if j not in used_plates]
+        relabel = {old: new for new, old in enumerate(ordered)}
+
+        hint_vars = []
+        hint_values = []
+        for tag, plate_index, ups in seed_solution:
+            i = tag_index[id(tag)]
+            hint_vars.append(tag_to_plate[i])
+            hint_values.append(relabel[plate_index])
+            hint_vars.append(ups_vars[i])
+            hint_values.append(ups)
+        for j in all_plates:
+            hint_vars.append(plate_sheets[j])
+            hint_values.append(sheet_hints[ordered[j]])
+        model.Proto().solution_hint.vars.extend(v.Index() for v in hint_vars)
+        model.Proto().solution_hint.values.extend(hint_values)
+
     # Track which plates are actually used
     plate_used = [model.NewBoolVar(f'plate_used_{j}') for j in all_plates]
     tag_on_plate = [[model.NewBoolVar(f'tag_{i}_on_plate_{j}') for j in all_plates] for i in range(num_tags)]
 
+    # One AddMapDomain per tag installs the full tag_to_plate <-> booleans
+    # channeling with a specialized propagator instead of 2*P reified
+    # equalities per tag
+    for i in range(num_tags):
+        model.AddMapDomain(tag_to_plate[i], tag_on_plate[i])
+
     for j in all_plates:
-        used_bools = []
-        for i in range(num_tags):
-            model.Add(tag_to_plate[i] == j).OnlyEnforceIf(tag_on_plate[i][j])
-            model.Add(tag_to_plate[i] != j).OnlyEnforceIf(tag_on_plate[i][j].Not())
-            used_bools.append(tag_on_plate[i][j])
+        used_bools = [tag_on_plate[i][j] for i in range(num_tags)]
 
-            product_var = model.NewIntVar(1, 1000000, f'prod_tag_{i}_plate_{j}')
-            model.AddMultiplicationEquality(product_var, [plate_sheets[j], ups_vars[i]])
-            model.Add(product_var >= tags[i]['QTY']).OnlyEnforceIf(tag_on_plate[i][j])
-            
         # Enforce that if any tag is assigned to plate j, the plate is used
         model.AddBoolOr(used_bools).OnlyEnforceIf(plate_used[j])
         model.AddBoolAnd([ub.Not() for ub in used_bools]).OnlyEnforceIf(plate_used[j].Not())
-        
+
+    # Plates are interchangeable, so break the permutation symmetry: used
+    # plates occupy a prefix ordered by non-decreasing sheet count, and
+    # unused plates are pinned to the 1-sheet minimum
+    for j in range(plate_count - 1):
+        model.Add(plate_used[j] >= plate_used[j + 1])
+        model.Add(plate_sheets[j] <= plate_sheets[j + 1]).OnlyEnforceIf(plate_used[j + 1])
+    for j in all_plates:
+        model.Add(plate_sheets[j] == 1).OnlyEnforceIf(plate_used[j].Not())
+
+    # Demand coverage: pick the assigned plate's sheet count with AddElement,
+    # then one multiplication per tag instead of one per (tag, plate) pair
+    for i in range(num_tags):
+        tag_sheets = model.NewIntVar(1, 10000, f'tag_{i}_sheets')
+        model.AddElement(tag_to_plate[i], plate_sheets, tag_sheets)
+        produced_var = model.NewIntVar(1, 10000 * ups_per_plate, f'produced_tag_{i}')
+        model.AddMultiplicationEquality(produced_var, [tag_sheets, ups_vars[i]])
+        model.Add(produced_var >= tags[i]['QTY'])
+
     for j in all_plates:
         ups_sum = []
         for i in range(num_tags):
+            # Reified linear constraints instead of a multiplication propagator:
+            # term equals ups_vars[i] when the tag sits on plate j, 0 otherwise
             term = model.NewIntVar(0, ups_per_plate, f'active_ups_{i}_{j}')
-            model.AddMultiplicationEquality(term, [ups_vars[i], tag_on_plate[i][j]])
+            model.Add(term == ups_vars[i]).OnlyEnforceIf(tag_on_plate[i][j])
+            model.Add(term == 0).OnlyEnforceIf(tag_on_plate[i][j].Not())
             ups_sum.append(term)
             
         total_ups_on_plate = model.NewIntVar(0, ups_per_plate, f'total_ups_plate_{j}')
@@ -249,23 +347,10 @@ def solve_plate_optimization(tags, ups_per_plate, plate_count, seed_solution, ve
             
             # If single tag indicator is true, plate CANNOT be used
             model.AddImplication(single_tag_indicator, plate_used[j].Not())
-            
-        else:
-            # For smaller datasets, keep the old logic but make it work properly
-            tag_count = model.NewIntVar(0, num_tags, f'tag_count_plate_{j}')
-            model.Add(tag_count == sum(tag_on_plate[i][j] for i in range(num_tags)))
-
-            only_one_tag = model.NewBoolVar(f'only_one_tag_plate_{j}')
-            model.Add(tag_count == 1).OnlyEnforceIf(only_one_tag)
-            model.Add(tag_count != 1).OnlyEnforceIf(only_one_tag.Not())
 
-            under_utilized = model.NewBoolVar(f'under_utilized_plate_{j}')
-            model.Add(total_ups_on_plate == ups_per_plate).OnlyEnforceIf(under_utilized)
-            model.Add(total_ups_on_plate != ups_per_plate).OnlyEnforceIf(under_utilized.Not())
-
-            forbidden_combo = model.NewBoolVar(f'forbidden_combo_{j}')
-            model.AddBoolAnd([only_one_tag, under_utilized]).OnlyEnforceIf(forbidden_combo)
-            model.Add(forbidden_combo == 0)  # Forbid it
+        # Smaller datasets used to build a forbidden_combo reification here,
+        # but fixing its enforcement literal to 0 made the whole construction
+        # vacuous, so it is simply dropped (single-tag plates stay allowed)
 
     model.Minimize(sum(plate_sheets))
 
@@ -273,43 +358,55 @@ def solve_plate_optimization(tags, ups_per_plate, plate_count, seed_solution, ve
     
     # Time constraints based on dataset size
     if len(tags) > 100:
-        # For large datasets > 100: No time limit, use improvement-based stopping
+        # For large datasets > 100: improvement-based stopping plus native
+        # termination knobs (hard safety cap + near-optimality gap)
+        solver.parameters.max_time_in_seconds = 3600
+        solver.parameters.relative_gap_limit = 0.01
+        solver.parameters.log_search_progress = verbose
+        # Explicit search knobs for the large regime: keep full search
+        # alongside the LNS workers, tighten the LP relaxation, and let the
+        # solver exploit symmetry and diversified neighborhoods
+        solver.parameters.use_lns_only = False
+        solver.parameters.linearization_level = 2
+        solver.parameters.cp_model_presolve = True
+        solver.parameters.symmetry_level = 2
+        solver.parameters.use_rins_lns = True
+        solver.parameters.diversify_lns_params = True
         if verbose:
-            print(f"\n🚀 Starting optimization for {len(tags)} tags (Large Dataset)...")
-            print(f"   ➤ Will stop if no improvement for 10 minutes")
+            logger.info('Starting optimization for %d tags (large dataset); '
+                        'stops after 10 minutes without improvement', len(tags))
     elif len(tags) > 50:
         solver.parameters.max_time_in_seconds = 900  # 15 minutes
         if verbose:
-            print(f"\n🚀 Starting optimization for {len(tags)} tags...")
-            print(f"   ➤ Time limit: 15 minutes")
+            logger.info('Starting optimization for %d tags; time limit 15 minutes', len(tags))
     elif len(tags) > 25:
         solver.parameters.max_time_in_seconds = 300  # 5 minutes
         if verbose:
-            print(f"\n🚀 Starting optimization for {len(tags)} tags...")
-            print(f"   ➤ Time limit: 5 minutes")
+            logger.info('Starting optimization for %d tags; time limit 5 minutes', len(tags))
     else:
         solver.parameters.max_time_in_seconds = 60
         if verbose:
-            print(f"\n🚀 Starting optimization for {len(tags)} tags...")
-            print(f"   ➤ Time limit: 2 minutes")
+            logger.info('Starting optimization for %d tags; time limit 1 minute', len(tags))
         
     solver.parameters.random_seed = 42
-    solver.parameters.num_search_workers = 8
+    solver.parameters.num_search_workers = os.cpu_count() or 8
+    # Let the solver patch up the hint instead of discarding it if imperfect
+    solver.parameters.repair_hint = True
 
-    cb = PlateOptimizationCallback(tag_to_plate, ups_vars, plate_sheets, tags, plate_count, ups_per_plate, verbose=verbose)
+    cb = PlateOptimizationCallback(tag_to_plate, ups_vars, plate_sheets, tags, verbose=verbose)
     status = solver.SolveWithSolutionCallback(model, cb)
 
-    print(f"Solver status: {solver.StatusName(status)}")
-    print(f"Total solutions tried: {cb.solution_count}")
-    print(f"Wall time: {solver.WallTime():.2f}s")
-    print(f"Best objective bound: {solver.BestObjectiveBound()}")
-    print(f"Best found objective: {cb.best_obj}")
+    logger.info('Solver finished: status=%s solutions=%d wall_time=%.2fs bound=%s best=%s',
+                solver.StatusName(status), cb.solution_count, solver.WallTime(),
+                solver.BestObjectiveBound(), cb.best_obj)
+
+    if cb.best_raw:
+        best_solution = build_solution(tags, cb.best_raw, plate_count, ups_per_plate, total_items)
 
-    if cb.best_solution:
         # Validate the solution to ensure no single-tag plates for large datasets
         if enforce_min_tags:
             plate_tag_counts = {}
-            for result in cb.best_solution["results"]:
+            for result in best_solution["results"]:
                 plate = result["PLATE"]
                 if plate not in plate_tag_counts:
                     plate_tag_counts[plate] = 0
@@ -317,12 +414,9 @@ def solve_plate_optimization(tags, ups_per_plate, plate_count, seed_solution, ve
             
             single_tag_plates = [plate for plate, count in plate_tag_counts.items() if count == 1]
             if single_tag_plates:
-                print(f"⚠️ WARNING: Found single-tag plates: {single_tag_plates}")
-                print("This should not happen with the new constraints!")
-            else:
-                print("✅ SUCCESS: No single-tag plates found!")
-        
-        return cb.best_solution
+                logger.warning('Found single-tag plates despite constraints: %s', single_tag_plates)
+
+        return best_solution
 
-    print("⚠️ No solution was found!")
+    logger.warning('No solution was found')
     return {"error": "No solution found"}
\ No newline at end of file
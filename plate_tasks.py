@@ -1,12 +1,109 @@
 # plate_tasks.py
 from celery_config import celery_app
-from optimizer_logic import greedy_initialize, solve_plate_optimization
+from optimizer_logic import multi_start_greedy, seed_objective, solve_plate_optimization
+import hashlib
+import json
 import logging
+from uuid import uuid4
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Result cache settings: identical payloads skip the solve entirely
+CACHE_TTL_SECONDS = 86400
+CACHE_MAX_BYTES = 256 * 1024  # don't let huge results eat Redis RAM
+
+# Full results live outside the Celery result backend under their own key,
+# so the backend only ever stores a small pointer
+RESULT_TTL_SECONDS = 3600
+
+# Latest best assignment per (ups, plateCount), reused to warm-start the
+# next solve with a similar payload
+WARMSTART_TTL_SECONDS = 7 * 86400
+
+
+def _cache_key(data):
+    canonical = json.dumps(data, sort_keys=True).encode()
+    return 'plate:' + hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def _cache_get(key):
+    try:
+        cached = celery_app.backend.client.get(key)
+        return json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning(f"Result cache read failed: {str(e)}")
+        return None
+
+
+def _tag_signature(tag):
+    return str(tag.get('ITEM_CODE') or f"{tag['COLOR']}|{tag['SIZE']}")
+
+
+def _load_warmstart(tags, ups_per_plate, plate_count):
+    """Map the previous best assignment onto the current tags, if it covers them all."""
+    try:
+        stored = celery_app.backend.client.get(f'warmstart:{ups_per_plate}:{plate_count}')
+        if not stored:
+            return None
+        assignment = json.loads(stored)
+        signatures = [_tag_signature(tag) for tag in tags]
+        if len(set(signatures)) != len(signatures):
+            # Colliding signatures would all inherit the same (plate, ups)
+            # and yield an infeasible seed, so don't warm-start at all
+            return None
+        seed = []
+        for tag, signature in zip(tags, signatures):
+            prev = assignment.get(signature)
+            if prev is None:
+                return None  # partial hints degrade the solve; require full coverage
+            plate_index, ups = prev
+            if not (0 <= plate_index < plate_count and 1 <= ups <= ups_per_plate):
+                return None
+            seed.append((tag, plate_index, ups))
+        return seed
+    except Exception as e:
+        logger.warning(f"Warm start read failed: {str(e)}")
+        return None
+
+
+def _save_warmstart(result, ups_per_plate, plate_count):
+    try:
+        assignment = {
+            _tag_signature(row): [ord(row['PLATE']) - 65, row['OPTIMAL_UPS']]
+            for row in result['results']
+        }
+        if len(assignment) != len(result['results']):
+            # Duplicate signatures collapsed in the dict; the stored map
+            # would be ambiguous, so skip persisting this run
+            return
+        celery_app.backend.client.set(
+            f'warmstart:{ups_per_plate}:{plate_count}',
+            json.dumps(assignment),
+            ex=WARMSTART_TTL_SECONDS,
+        )
+    except Exception as e:
+        logger.warning(f"Warm start write failed: {str(e)}")
+
+
+def _store_result(result):
+    """Park the full result in its own Redis key and return a small pointer."""
+    rid = uuid4().hex
+    celery_app.backend.client.set(
+        f'plate-result:{rid}', json.dumps(result), ex=RESULT_TTL_SECONDS
+    )
+    return {'result_key': rid}
+
+
+def _cache_set(key, result):
+    try:
+        payload = json.dumps(result)
+        if len(payload) <= CACHE_MAX_BYTES:
+            celery_app.backend.client.set(key, payload, ex=CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Result cache write failed: {str(e)}")
+
 @celery_app.task(name='plate_tasks.run_plate_optimization', bind=True)
 def run_plate_optimization(self, data):
     try:
@@ -15,18 +112,38 @@ def run_plate_optimization(self, data):
         tags = data['tags']
         ups_per_plate = data['upsPerPlate']
         plate_count = data['plateCount']
-        
+
+        # Repeat payloads (common while tuning ups/plateCount in the UI)
+        # are served straight from the cache
+        cache_key = _cache_key(data)
+        cached_result = _cache_get(cache_key)
+        if cached_result is not None:
+            logger.info("Returning cached optimization result")
+            return _store_result(cached_result)
+
         # Update progress
         self.update_state(state='PROGRESS', meta={'status': 'Initializing...'})
         
-        seed = greedy_initialize(tags, ups_per_plate, plate_count)
-        
+        seed = multi_start_greedy(tags, ups_per_plate, plate_count)
+
+        # A previous solve with the same (ups, plateCount) often beats a
+        # fresh greedy when the tag mix barely changed
+        previous_seed = _load_warmstart(tags, ups_per_plate, plate_count)
+        if previous_seed and seed_objective(previous_seed) < seed_objective(seed):
+            logger.info("Warm-starting from previous best assignment")
+            seed = previous_seed
+
+
         # Update progress
         self.update_state(state='PROGRESS', meta={'status': 'Optimizing...'})
         result = solve_plate_optimization(tags, ups_per_plate, plate_count, seed, verbose=True)
         
+        if "error" not in result:
+            _cache_set(cache_key, result)
+            _save_warmstart(result, ups_per_plate, plate_count)
+
         logger.info("Optimization completed successfully")
-        return result
+        return _store_result(result)
     except Exception as e:
         logger.error(f"Optimization failed: {str(e)}")
         self.update_state(state='FAILURE', meta={'error': str(e)})